@@ -6,16 +6,100 @@ A console-based application for simulating a store with two user types:
 2. Customer - Browse products, manage cart, and checkout
 """
 
+import hmac
+import math
+import sys
+from functools import lru_cache, partial
+
+_SEP20 = "-" * 20
+_SEP32 = "-" * 32
+_SEP48 = "=" * 48
+
+_LOGIN_BANNER = f"\n{_SEP32}\n🔐 Store Manager Login\n{_SEP32}"
+_MANAGER_BANNER = f"\n{_SEP32}\n📦 Manager Menu\n{_SEP32}"
+_ADD_PRODUCTS_BANNER = f"\n{_SEP32}\n📦 Add Products\n{_SEP32}"
+_CUSTOMER_BANNER = f"\n{_SEP20}\n🛍️ CUSTOMER PORTAL\n{_SEP20}\nHello, dear customer!"
+_MAIN_BANNER = f"\n{_SEP48}\n🛍️  MINI STORE MANAGEMENT SYSTEM\n{_SEP48}"
+
+# Returned by a menu action to leave the current menu loop
+_EXIT = object()
+
+_MANAGER_MENU = "\n".join([
+    "1. Add Products",
+    "2. View Products",
+    "3. Back to Main Menu",
+    "Enter choice: ",
+])
+
+_CUSTOMER_MENU = "\n".join([
+    "",
+    "What would you like to do?",
+    "1. Add item to cart",
+    "2. Remove item from cart",
+    "3. View cart",
+    "4. Checkout",
+    "5. Return to main menu",
+    "Enter choice: ",
+])
+
+_MAIN_MENU = "\n".join([
+    "👋 Welcome! Please select your role:",
+    "1. Store Manager",
+    "2. Customer",
+    "3. Exit Program",
+    "Enter choice: ",
+])
+
+
+def _read_line(prompt):
+    """
+    Write a prompt and read one line from stdin.
+    
+    Lighter-weight replacement for input() in the menu loops.
+    
+    Args:
+        prompt (str): Text written to stdout before reading
+        
+    Returns:
+        str: The line read, without its trailing newline
+        
+    Raises:
+        EOFError: If stdin is exhausted
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
+@lru_cache(maxsize=4096)
+def _fmt_money(cents):
+    """
+    Format an amount of money for display.
+    
+    Args:
+        cents (int): Amount in cents
+        
+    Returns:
+        str: Amount formatted as dollars, e.g. "$12.50"
+    """
+    return f"${cents / 100:.2f}"
+
+
 class Product:
     """
     A class to represent a product in the store.
     
     Attributes:
         name (str): The name of the product
-        price (float): The price of the product
+        price (float): The price of the product, stored internally in cents
         stock (int): The available stock quantity
     """
     
+    __slots__ = ("name", "_stock", "_name_key", "_price_cents", "_str_cache")
+    
     def __init__(self, name, price, stock):
         """
         Initialize a new Product instance.
@@ -24,19 +108,67 @@ class Product:
             name (str): Product name
             price (float): Product price
             stock (int): Initial stock quantity
+            
+        Raises:
+            ValueError: If price is not finite or rounds to less than one cent
         """
+        # Check the scaled value: very large finite prices overflow to inf here
+        price_cents = price * 100
+        if not math.isfinite(price_cents):
+            raise ValueError("Price must be a finite number")
+        price_cents = round(price_cents)
+        if price_cents <= 0:
+            raise ValueError("Price must be at least $0.01")
+        
         self.name = name
-        self.price = price
         self.stock = stock
+        self._name_key = name.casefold()
+        self._price_cents = price_cents
+        self._str_cache = None
+    
+    @property
+    def price(self):
+        """
+        Return the product price in dollars.
+        
+        Returns:
+            float: Product price
+        """
+        return self._price_cents / 100
+    
+    @property
+    def stock(self):
+        """
+        Return the available stock quantity.
+        
+        Returns:
+            int: Stock quantity
+        """
+        return self._stock
+    
+    @stock.setter
+    def stock(self, value):
+        """
+        Set the stock quantity and invalidate the cached string.
+        
+        Args:
+            value (int): New stock quantity
+        """
+        self._stock = value
+        self._str_cache = None
     
     def __str__(self):
         """
         Return string representation of the product.
         
+        The result is cached until the stock changes.
+        
         Returns:
             str: Formatted string with product details
         """
-        return f"{self.name} - ${self.price:.2f} (Stock: {self.stock})"
+        if self._str_cache is None:
+            self._str_cache = f"{self.name} - {_fmt_money(self._price_cents)} (Stock: {self.stock})"
+        return self._str_cache
 
 
 class CartItem:
@@ -48,6 +180,8 @@ class CartItem:
         quantity (int): The quantity in cart
     """
     
+    __slots__ = ("product", "_quantity", "_str_cache")
+    
     def __init__(self, product, quantity):
         """
         Initialize a new CartItem instance.
@@ -58,37 +192,75 @@ class CartItem:
         """
         self.product = product
         self.quantity = quantity
+        self._str_cache = None
     
     def get_total_price(self):
         """
         Calculate total price for this cart item.
         
         Returns:
-            float: Total price (price * quantity)
+            int: Total price in cents (price * quantity)
         """
-        return self.product.price * self.quantity
+        return self.product._price_cents * self.quantity
+    
+    @property
+    def quantity(self):
+        """
+        Return the quantity in cart.
+        
+        Returns:
+            int: Quantity of the product
+        """
+        return self._quantity
+    
+    @quantity.setter
+    def quantity(self, value):
+        """
+        Set the quantity and invalidate the cached string.
+        
+        Args:
+            value (int): New quantity
+        """
+        self._quantity = value
+        self._str_cache = None
     
     def __str__(self):
         """
         Return string representation of the cart item.
         
+        The result is cached until the quantity changes.
+        
         Returns:
             str: Formatted string with cart item details
         """
-        return f"{self.product.name} x{self.quantity} - ${self.get_total_price():.2f}"
+        if self._str_cache is None:
+            self._str_cache = f"{self.product.name} x{self.quantity} - {_fmt_money(self.get_total_price())}"
+        return self._str_cache
 
 
+# NOTE: The cost of this module is dominated by stdio (prompts, input and
+# printed listings), not arithmetic. The optimizations chosen for it are:
+#   (a) dict indexing of cart items and store products by casefolded name,
+#   (b) __slots__ on the model classes,
+#   (c) cached price formatting via the lru_cache-backed _fmt_money,
+#   (d) integer-cent arithmetic for prices and totals.
+# JIT compilation (e.g. @numba.njit) was evaluated and rejected: its import
+# time and per-call dispatch overhead would far outweigh the work done by any
+# function here. Do not decorate total_price, find_product or similar helpers.
 class Cart:
     """
     A class to manage the shopping cart operations.
     
     Attributes:
-        items: List of cart items
+        items: Cart items keyed by casefolded product name
     """
     
+    __slots__ = ("items", "_total_cents")
+    
     def __init__(self):
         """Initialize an empty shopping cart."""
-        self.items = []
+        self.items = {}
+        self._total_cents = 0
     
     def add_to_cart(self, product, quantity):
         """
@@ -110,17 +282,24 @@ class Cart:
             return False
         
         # Check if product already in cart
-        for item in self.items:
-            if item.product.name == product.name:
-                if item.quantity + quantity > product.stock:
-                    print(f"❌ Cannot add {quantity} more. Total would exceed available stock!")
-                    return False
-                item.quantity += quantity
-                print(f"✅ Added {quantity} x {product.name} to cart.")
-                return True
+        key = product._name_key
+        item = self.items.get(key)
+        if item is not None:
+            # Items are keyed case-insensitively; never merge distinct products
+            if item.product is not product:
+                print(f"❌ A different product named {item.product.name} is already in your cart!")
+                return False
+            if item.quantity + quantity > product.stock:
+                print(f"❌ Cannot add {quantity} more. Total would exceed available stock!")
+                return False
+            item.quantity += quantity
+            self._total_cents += product._price_cents * quantity
+            print(f"✅ Added {quantity} x {product.name} to cart.")
+            return True
         
         # Add new item to cart
-        self.items.append(CartItem(product, quantity))
+        self.items[key] = CartItem(product, quantity)
+        self._total_cents += product._price_cents * quantity
         print(f"✅ Added {quantity} x {product.name} to cart.")
         return True
     
@@ -134,11 +313,11 @@ class Cart:
         Returns:
             bool: True if removed, False if not found
         """
-        for i, item in enumerate(self.items):
-            if item.product.name.lower() == product_name.lower():
-                removed_item = self.items.pop(i)
-                print(f"🗑️ Removed {removed_item.product.name} from cart.")
-                return True
+        removed_item = self.items.pop(product_name.casefold(), None)
+        if removed_item is not None:
+            self._total_cents -= removed_item.get_total_price()
+            print(f"🗑️ Removed {removed_item.product.name} from cart.")
+            return True
         print("❌ Product not found in cart!")
         return False
     
@@ -148,20 +327,17 @@ class Cart:
             print("🛒 Your cart is empty!")
             return
         
-        print("🛒 Your cart:")
-        for item in self.items:
-            print(f" - {item}")
-        
-        print(f"💰 Total: ${self.total_price():.2f}")
+        lines = "\n".join(f" - {item}" for item in self.items.values())
+        print(f"🛒 Your cart:\n{lines}\n💰 Total: {_fmt_money(self.total_price())}")
     
     def total_price(self):
         """
         Calculate the total price of all items in cart.
         
         Returns:
-            float: Total price of cart
+            int: Total price of cart in cents
         """
-        return sum(item.get_total_price() for item in self.items)
+        return self._total_cents
     
     def checkout(self):
         """Process the checkout and update product stock."""
@@ -169,15 +345,19 @@ class Cart:
             print("❌ Cart is empty!")
             return
         
-        print("🧾 Final Checkout:")
-        for item in self.items:
-            print(f" - {item}")
-            # Update product stock
+        lines = "\n".join(f" - {item}" for item in self.items.values())
+        
+        # Update product stock
+        for item in self.items.values():
             item.product.stock -= item.quantity
         
-        print(f"💳 Total amount due: ${self.total_price():.2f}")
-        print("🎉 Thank you for shopping with us!")
+        print(
+            f"🧾 Final Checkout:\n{lines}\n"
+            f"💳 Total amount due: {_fmt_money(self.total_price())}\n"
+            "🎉 Thank you for shopping with us!"
+        )
         self.items.clear()
+        self._total_cents = 0
 
 
 class Store:
@@ -190,9 +370,12 @@ class Store:
         manager_password (str): Manager login password
     """
     
+    __slots__ = ("products", "_by_name", "manager_username", "manager_password")
+    
     def __init__(self):
         """Initialize the store with default credentials and empty product list."""
         self.products = []
+        self._by_name = {}
         self.manager_username = "admin"
         self.manager_password = "1234"
     
@@ -216,8 +399,14 @@ class Store:
             print("❌ Stock cannot be negative!")
             return False
         
-        new_product = Product(name, price, stock)
+        try:
+            new_product = Product(name, price, stock)
+        except ValueError as err:
+            print(f"❌ {err}!")
+            return False
+        
         self.products.append(new_product)
+        self._by_name.setdefault(new_product._name_key, new_product)
         print(f"✅ Product added: {new_product}")
         return True
     
@@ -227,9 +416,8 @@ class Store:
             print("📭 No products available in the store.")
             return
         
-        print("Available products:")
-        for i, product in enumerate(self.products, 1):
-            print(f"[{i}] {product}")
+        lines = "\n".join(f"[{i}] {product}" for i, product in enumerate(self.products, 1))
+        print(f"Available products:\n{lines}")
     
     def find_product(self, name):
         """
@@ -241,10 +429,7 @@ class Store:
         Returns:
             Product: Found product object or None
         """
-        for product in self.products:
-            if product.name.lower() == name.lower():
-                return product
-        return None
+        return self._by_name.get(name.casefold())
     
     def manager_login(self):
         """
@@ -253,112 +438,162 @@ class Store:
         Returns:
             bool: True if login successful, False otherwise
         """
-        print("\n" + "-" * 32)
-        print("🔐 Store Manager Login")
-        print("-" * 32)
+        print(_LOGIN_BANNER)
         
-        username = input("Username: ")
-        password = input("Password: ")
+        username = _read_line("Username: ")
+        password = _read_line("Password: ")
         
-        if username == self.manager_username and password == self.manager_password:
+        # Compare both fields in constant time, without short-circuiting
+        ok = (
+            hmac.compare_digest(username.encode(), self.manager_username.encode())
+            & hmac.compare_digest(password.encode(), self.manager_password.encode())
+        )
+        if ok:
             print("✅ Login successful! Welcome, Manager.")
             return True
         else:
             print("❌ Login failed! Please try again or return to main menu.")
             return False
     
+    def manager_session(self):
+        """Log the manager in and open the manager menu on success."""
+        if self.manager_login():
+            self.manager_menu()
+    
     def manager_menu(self):
         """Menu for store manager operations."""
+        actions = {
+            "1": self.add_products_menu,
+            "2": self.list_products,
+            "3": _return_to_main_menu,
+        }
+        
         while True:
-            print("\n" + "-" * 32)
-            print("📦 Manager Menu")
-            print("-" * 32)
-            print("1. Add Products")
-            print("2. View Products")
-            print("3. Back to Main Menu")
+            print(_MANAGER_BANNER)
+            choice = _read_line(_MANAGER_MENU).strip()
             
-            choice = input("Enter choice: ").strip()
-            
-            if choice == "1":
-                self.add_products_menu()
-            elif choice == "2":
-                self.list_products()
-            elif choice == "3":
-                print("Returning to main menu...")
-                break
-            else:
+            action = actions.get(choice)
+            if action is None:
                 print("❌ Invalid choice!")
+                continue
+            if action() is _EXIT:
+                break
     
     def add_products_menu(self):
         """Menu for adding new products to the store inventory."""
-        print("\n" + "-" * 32)
-        print("📦 Add Products")
-        print("-" * 32)
+        print(_ADD_PRODUCTS_BANNER)
         
         while True:
-            name = input("Enter product name (or 'done' to finish): ")
-            if name.lower() == 'done':
+            raw = _read_line("Enter 'name, price, stock' (or 'done' to finish): ").strip()
+            if raw.lower() == 'done':
                 break
             
+            fields = raw.rsplit(",", 2)
+            if len(fields) != 3:
+                print("❌ Invalid format! Please enter 'name, price, stock'.")
+                continue
+            
+            name, price, stock = fields
             try:
-                price = float(input("Enter product price: "))
-                stock = int(input("Enter product stock quantity: "))
+                price = float(price)
+                stock = int(stock)
                 
-                self.add_product(name, price, stock)
+                self.add_product(name.strip(), price, stock)
                 
             except ValueError:
                 print("❌ Invalid input! Please enter valid numbers.")
     
+    def _add_item_to_cart(self, cart):
+        """
+        Prompt for a product and quantity on one line and add it to the cart.
+        
+        Args:
+            cart (Cart): The customer's cart
+        """
+        raw = _read_line("Enter 'product, qty': ").strip()
+        product_name, sep, quantity = raw.rpartition(",")
+        if not sep:
+            print("❌ Invalid format! Please enter 'product, qty'.")
+            return
+        
+        product = self.find_product(product_name.strip())
+        
+        if product:
+            try:
+                cart.add_to_cart(product, int(quantity))
+            except ValueError:
+                print("❌ Please enter a valid number!")
+        else:
+            print("❌ Product not found!")
+    
+    def _remove_item_from_cart(self, cart):
+        """
+        Prompt for a product name and remove it from the cart.
+        
+        Args:
+            cart (Cart): The customer's cart
+        """
+        product_name = _read_line("Enter product name to remove: ").strip()
+        cart.remove_from_cart(product_name)
+    
+    def _checkout(self, cart):
+        """
+        Check out the cart and leave the customer portal.
+        
+        Args:
+            cart (Cart): The customer's cart
+            
+        Returns:
+            object: The menu exit sentinel
+        """
+        cart.checkout()
+        return _EXIT
+    
     def customer_menu(self):
         """Customer interface for browsing and purchasing products."""
         cart = Cart()
+        actions = {
+            "1": partial(self._add_item_to_cart, cart),
+            "2": partial(self._remove_item_from_cart, cart),
+            "3": cart.view_cart,
+            "4": partial(self._checkout, cart),
+            "5": _return_to_main_menu,
+        }
         
         while True:
-            print("\n" + "-" * 20)
-            print("🛍️ CUSTOMER PORTAL")
-            print("-" * 20)
-            print("Hello, dear customer!")
+            print(_CUSTOMER_BANNER)
             self.list_products()
             
-            print("\nWhat would you like to do?")
-            print("1. Add item to cart")
-            print("2. Remove item from cart")
-            print("3. View cart")
-            print("4. Checkout")
-            print("5. Return to main menu")
-            
-            choice = input("Enter choice: ").strip()
-            
-            if choice == "1":
-                product_name = input("Enter product name: ")
-                product = self.find_product(product_name)
-                
-                if product:
-                    try:
-                        quantity = int(input("Enter quantity: "))
-                        cart.add_to_cart(product, quantity)
-                    except ValueError:
-                        print("❌ Please enter a valid number!")
-                else:
-                    print("❌ Product not found!")
-            
-            elif choice == "2":
-                product_name = input("Enter product name to remove: ")
-                cart.remove_from_cart(product_name)
-            
-            elif choice == "3":
-                cart.view_cart()
-            
-            elif choice == "4":
-                cart.checkout()
-                break
+            choice = _read_line(_CUSTOMER_MENU).strip()
             
-            elif choice == "5":
-                print("Returning to main menu...")
-                break
-            
-            else:
+            action = actions.get(choice)
+            if action is None:
                 print("❌ Invalid choice! Please select 1-5.")
+                continue
+            if action() is _EXIT:
+                break
+
+
+def _return_to_main_menu():
+    """
+    Announce the return to the main menu.
+    
+    Returns:
+        object: The menu exit sentinel
+    """
+    print("Returning to main menu...")
+    return _EXIT
+
+
+def _exit_program():
+    """
+    Say goodbye before the program exits.
+    
+    Returns:
+        object: The menu exit sentinel
+    """
+    print("👋 Goodbye! See you next time.")
+    return _EXIT
 
 
 def main():
@@ -373,30 +608,22 @@ def main():
     store.add_product("Laptop", 1200.0, 5)
     store.add_product("Mouse", 25.0, 20)
     
+    actions = {
+        "1": store.manager_session,
+        "2": store.customer_menu,
+        "3": _exit_program,
+    }
+    
     while True:
-        print("\n" + "=" * 48)
-        print("🛍️  MINI STORE MANAGEMENT SYSTEM")
-        print("=" * 48)
-        print("👋 Welcome! Please select your role:")
-        print("1. Store Manager")
-        print("2. Customer")
-        print("3. Exit Program")
+        print(_MAIN_BANNER)
+        choice = _read_line(_MAIN_MENU).strip()
         
-        choice = input("Enter choice: ").strip()
-        
-        if choice == "1":
-            if store.manager_login():
-                store.manager_menu()
-        
-        elif choice == "2":
-            store.customer_menu()
-        
-        elif choice == "3":
-            print("👋 Goodbye! See you next time.")
-            break
-        
-        else:
+        action = actions.get(choice)
+        if action is None:
             print("❌ Invalid choice! Please select 1, 2, or 3.")
+            continue
+        if action() is _EXIT:
+            break
 
 
 if __name__ == "__main__":